@@ -1,4 +1,4 @@
 from flask_sqlalchemy import SQLAlchemy
 
-db: SQLAlchemy = SQLAlchemy()
+db: SQLAlchemy = SQLAlchemy(session_options={'expire_on_commit': False})
 
@@ -29,7 +29,7 @@ class AuthResource(Resource):
         try:
             login_data = LoginSchema(**data)
         except ValidationError as err:
-            current_app.logger.warning(f"Validation error: {err.errors()}")
+            current_app.logger.warning(f"Validation error: {err.errors(include_url=False, include_input=False)}")
             return make_response(jsonify({"message": "Invalid input data."}), 400)
 
         user_auth: UserAuth = UserAuth(db_extension)
@@ -59,7 +59,7 @@ class RegisterResource(Resource):
         try:
             register_data = RegisterSchema(**data)
         except ValidationError as err:
-            current_app.logger.warning(f"Validation error: {err.errors()}")
+            current_app.logger.warning(f"Validation error: {err.errors(include_url=False, include_input=False)}")
             return make_response(jsonify({"message": "Invalid input data."}), 400)
 
         user_auth: UserAuth = UserAuth(db_extension)
@@ -46,8 +46,9 @@ class RecipeListResource(Resource):
             recipe_data = RecipeSchema(**json_data)
             current_app.logger.info(f"Validated data: {recipe_data.model_dump()}")
         except ValidationError as err:
-            current_app.logger.error(f"Validation error: {err.errors()}")
-            return make_response(jsonify(err.errors()), 422)
+            errors = err.errors()
+            current_app.logger.error(f"Validation error: {errors}")
+            return make_response(jsonify(errors), 422)
 
         try:
             self.recipe_manager.add_recipe(
@@ -90,13 +91,11 @@ class RecipeResource(Resource):
     def delete(self, recipe_id: int) -> Response:
         user_id = get_jwt_identity()
         try:
-            recipe = self.recipe_manager.get_recipe_by_id(recipe_id, user_id)
-            if recipe is None:
-                return make_response(jsonify({"message": "Recipe not found"}), 404)
-
             self.recipe_manager.delete_recipe(recipe_id, user_id)
             current_app.logger.info(f"Recipe with ID {recipe_id} deleted successfully.")
             return make_response("", 204)
+        except ValueError:
+            return make_response(jsonify({"message": "Recipe not found"}), 404)
         except Exception as e:
             current_app.logger.error(f"Error deleting recipe: {e}")
             return make_response(jsonify({"message": "Failed to delete recipe."}), 500)
@@ -58,4 +58,4 @@ class ShoppingListResource(Resource):
         if not ingredients:
             return make_response(jsonify({"message": "No meal plan for this date range."}), 404)
 
-        return make_response(jsonify({"ingredients": list(ingredients), "date_range": date_range_data.start_date.isoformat() + " to " + date_range_data.end_date.isoformat()}), 200)
\ No newline at end of file
+        return make_response(jsonify({"ingredients": list(ingredients), "date_range": f"{start_date.isoformat()} to {end_date.isoformat()}"}), 200)
\ No newline at end of file
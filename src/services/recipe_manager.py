@@ -51,6 +51,10 @@ class AbstractRecipeManager(ABC):
     def get_ingredients_by_meal_name(self, user_id: int, meal: str) -> str | None:
         raise NotImplementedError('Retrieve ingredients for a recipe by its meal name for the specified user ID.')
 
+    @abstractmethod
+    def get_ingredients_by_meal_names(self, user_id: int, meal_names: set[str]) -> dict[str, list[str]]:
+        raise NotImplementedError('Retrieve ingredients for several recipes by their meal names for the specified user ID.')
+
 
 
 class RecipeManager(AbstractRecipeManager):
@@ -139,3 +143,14 @@ class RecipeManager(AbstractRecipeManager):
     def get_ingredients_by_meal_name(self, user_id: int, meal: str) -> str | None:
         recipe: Recipe | None = self.db.session.query(Recipe).filter_by(user_id=user_id, meal_name=meal).first()
         return recipe.ingredients if recipe else None
+
+    def get_ingredients_by_meal_names(self, user_id: int, meal_names: set[str]) -> dict[str, list[str]]:
+        rows = self.db.session.query(Recipe.meal_name, Recipe.ingredients).filter(
+            Recipe.user_id == user_id,
+            Recipe.meal_name.in_(meal_names)
+        ).all()
+        ingredients_by_meal: dict[str, list[str]] = {}
+        for meal_name, ingredients in rows:
+            if meal_name not in ingredients_by_meal:
+                ingredients_by_meal[meal_name] = json.loads(ingredients)
+        return ingredients_by_meal
@@ -2,7 +2,6 @@ import logging
 from datetime import date
 from typing import Generator
 
-from helpers.date_range_generator import generate_date_list
 from services.recipe_manager import AbstractRecipeManager
 from services.user_plan_manager import AbstractUserPlanManager
 
@@ -17,25 +16,24 @@ class ShoppingListService:
 
     def get_ingredients_for_date_range(self, user_id: int, date_range: tuple[date, date]) -> set[str]:
         start_date, end_date = date_range
-        ingredients: set[str] = set()
-        date_list = generate_date_list(start_date, end_date)
 
         logging.info(f"Fetching ingredients for user {user_id} from {start_date} to {end_date}")
-        for current_date in date_list:
-            user_plan = self.user_plan_manager.get_plans(user_id=user_id, date=current_date)
-            logging.info(f"User plan for {current_date}: {user_plan}")
-
-            if not user_plan:
-                logging.info(f"No plan found for user {user_id} on {current_date}.")
-                continue
+        user_plans = self.user_plan_manager.get_plans_for_range(user_id, start_date, end_date)
+        if not user_plans:
+            logging.info(f"No plans found for user {user_id} from {start_date} to {end_date}.")
+            return set()
 
-            meal_names: Generator[str, None, None] = self._get_meal_names(user_plan)
+        meal_names: set[str] = set()
+        for user_plan in user_plans:
+            current_date = user_plan['date']
+            logging.info(f"User plan for {current_date}: {user_plan}")
+            meal_names.update(self._get_meal_names(user_plan))
 
-            for meal_name in meal_names:
-                new_ingredients: set[str] = self._get_ingredients_for_meals(user_id, [meal_name])
-                logging.info(f"Ingredients for {meal_name} on {current_date}: {new_ingredients}")
+        if not meal_names:
+            logging.info(f"No meals planned for user {user_id} from {start_date} to {end_date}.")
+            return set()
 
-                ingredients.update(new_ingredients)
+        ingredients: set[str] = self._get_ingredients_for_meals(user_id, meal_names)
 
         if not ingredients:
             logging.warning(f"No ingredients found for user {user_id} in the date range {start_date} to {end_date}.")
@@ -55,11 +53,10 @@ class ShoppingListService:
             return meal_info.split('(ID:')[0].strip()
         return meal_info
 
-    def _get_ingredients_for_meals(self, user_id: int, meal_names: list[str]) -> set[str]:
+    def _get_ingredients_for_meals(self, user_id: int, meal_names: set[str]) -> set[str]:
         ingredients: set[str] = set()
-        for meal_name in meal_names:
-            if (recipe := self.recipe_manager.get_recipe_by_name(user_id, meal_name)):
-                logging.info(f"Recipe for {meal_name}: {recipe}")
-                if 'ingredients' in recipe:
-                    ingredients.update(recipe['ingredients'])
+        ingredients_by_meal = self.recipe_manager.get_ingredients_by_meal_names(user_id, meal_names)
+        for meal_name, meal_ingredients in ingredients_by_meal.items():
+            logging.info(f"Ingredients for {meal_name}: {meal_ingredients}")
+            ingredients.update(meal_ingredients)
         return ingredients
\ No newline at end of file
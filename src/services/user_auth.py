@@ -4,6 +4,8 @@ from flask import current_app
 from models.recipes import User
 from flask_sqlalchemy import SQLAlchemy
 
+PASSWORD_SYMBOLS: frozenset[str] = frozenset({'!', '#', '?', '%', '$', '&'})
+
 
 class UserAuth:
     def __init__(self, db: SQLAlchemy) -> None:
@@ -73,7 +75,6 @@ class RegistrationService:
         
 class PasswordValidator:
     def validate(self, password: str) -> bool:
-        symbols: set[str] = {'!', '#', '?', '%', '$', '&'}
         if not (8 <= len(password) <= 20):
             return False
 
@@ -89,7 +90,7 @@ class PasswordValidator:
                 has_upper = True
             elif char.islower():
                 has_lower = True
-            elif char in symbols:
+            elif char in PASSWORD_SYMBOLS:
                 has_symbol = True
 
             if has_digit and has_upper and has_lower and has_symbol:
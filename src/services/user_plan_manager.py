@@ -12,6 +12,10 @@ class AbstractUserPlanManager(ABC):
     def get_plans(self, user_id: int, date: date_type) -> dict[str, int | date_type | str]:
         raise NotImplementedError('This method should retrieve the meal plans for a user on a specific date.')
 
+    @abstractmethod
+    def get_plans_for_range(self, user_id: int, start_date: date_type, end_date: date_type) -> list[dict[str, int | date_type | str]]:
+        raise NotImplementedError('This method should retrieve the meal plans for a user within the given date range.')
+
     @abstractmethod
     def create_or_update_plan(self, user_id: int, selected_date: datetime, recipe_id: int, meal_type: str) -> dict[str, Any]:
         raise NotImplementedError('This method should create or update a meal plan for the user on the specified date with the given recipe ID and meal type.')
@@ -38,14 +42,7 @@ class SqliteUserPlanManager(AbstractUserPlanManager):
         ).first()
 
         if plan:
-            result = {
-                'user_id': plan.user_id,
-                'date': plan.date,
-                'breakfast': plan.breakfast,
-                'lunch': plan.lunch,
-                'dinner': plan.dinner,
-                'dessert': plan.dessert
-            }
+            result = self._plan_to_dict(plan)
             current_app.logger.info(f"Found plan: {result}")
         else:
             result = {}
@@ -53,16 +50,35 @@ class SqliteUserPlanManager(AbstractUserPlanManager):
 
         return result
 
+    def get_plans_for_range(self, user_id: int, start_date: date_type, end_date: date_type) -> list[dict[str, int | date_type | str]]:
+        current_app.logger.info(f"Attempting to get plans for user_id: {user_id}, from {start_date} to {end_date}")
+
+        plans: list[UserPlan] = self.db.session.query(UserPlan).filter(
+            UserPlan.user_id == user_id,
+            UserPlan.date.between(start_date, end_date)
+        ).order_by(UserPlan.date).all()
+
+        current_app.logger.info(f"Found {len(plans)} plan(s) between {start_date} and {end_date}")
+        return [self._plan_to_dict(plan) for plan in plans]
+
+    def _plan_to_dict(self, plan: UserPlan) -> dict[str, int | date_type | str]:
+        return {
+            'user_id': plan.user_id,
+            'date': plan.date,
+            'breakfast': plan.breakfast,
+            'lunch': plan.lunch,
+            'dinner': plan.dinner,
+            'dessert': plan.dessert
+        }
+
     def create_or_update_plan(self, user_id: int, selected_date: datetime, recipe_id: int, meal_type: str) -> dict[str, Any]:
         current_app.logger.info(f"Creating or updating plan for user_id: {user_id}, date: {selected_date}, recipe_id: {recipe_id}, meal_type: {meal_type}")
         
         selected_date_only = selected_date.date()
-        
-        plan: UserPlan | None = self.db.session.query(UserPlan).filter_by(user_id=user_id, date=selected_date_only).first()
-        
-        if plan is None: 
-            plan = UserPlan(user_id=user_id, date=selected_date_only)
-            self.db.session.add(plan)
+
+        if meal_type not in ['breakfast', 'lunch', 'dinner', 'dessert']:
+            current_app.logger.error(f"Invalid meal_type: {meal_type}")
+            raise ValueError(f"Invalid meal_type: {meal_type}")
 
         recipe: Recipe | None = self.db.session.query(Recipe).filter_by(id=recipe_id).first()
         if not recipe:
@@ -70,12 +86,13 @@ class SqliteUserPlanManager(AbstractUserPlanManager):
 
         meal_info: str = recipe.meal_name
 
-        if meal_type in ['breakfast', 'lunch', 'dinner', 'dessert']:
-            setattr(plan, meal_type, meal_info)
-        else:
-            current_app.logger.error(f"Invalid meal_type: {meal_type}")
-            raise ValueError(f"Invalid meal_type: {meal_type}")
+        plan: UserPlan | None = self.db.session.query(UserPlan).filter_by(user_id=user_id, date=selected_date_only).first()
+        
+        if plan is None: 
+            plan = UserPlan(user_id=user_id, date=selected_date_only)
+            self.db.session.add(plan)
 
+        setattr(plan, meal_type, meal_info)
         self.db.session.commit()
         current_app.logger.info(f"Plan updated: {plan}")
 